@@ -1,6 +1,6 @@
 import pyomo.environ as pyo
 import pyomo.mpec as mpec
-from pyomo.core.base.var import ScalarVar, IndexedVar
+from optml.utils import _extract_var_data
 
 pyomo_activations = {
     'tanh': pyo.tanh,
@@ -238,22 +238,3 @@ def build_relu_complementarity_formulation(block, network_structure, transform='
 #         from_offset += n_from
 #
 #     return w,b
-
-def _extract_var_data(vars):
-    if isinstance(vars, ScalarVar):
-        return [vars]
-    elif isinstance(vars, IndexedVar):
-        if vars.indexed_set().is_ordered():
-            return list(vars.values())
-        raise ValueError('Expected IndexedVar: {} to be indexed over an ordered set.'.format(vars))
-    elif isinstance(vars, list):
-        # Todo: the above if should check if the item supports iteration rather than only list?
-        varlist = list()
-        for v in vars:
-            if v.is_indexed():
-                varlist.extend(v.values())
-            else:
-                varlist.append(v)
-        return varlist
-    else:
-        raise ValueError("Unknown variable type {}".format(vars))
@@ -127,16 +127,16 @@ class _BaseInputOutputBlockData(_BlockData):
     def _setup_scaled_inputs_outputs(self, *, scaling_object=None, input_bounds=None, use_scaling_expressions=False):
         if scaling_object == None:
             #if no scaling, set scaled lists to the original lists
-            self.__scaled_inputs_list = self.inputs_list
-            self.__scaled_outputs_list = self.outputs_list
-            self._setup_input_bounds(self.inputs_list,input_bounds)
+            self.__scaled_inputs_list = self.__inputs_list
+            self.__scaled_outputs_list = self.__outputs_list
+            self._setup_input_bounds(self.__inputs_list,input_bounds)
 
         elif scaling_object and use_scaling_expressions:
             #use pyomo Expressions for scaled and unscaled terms, variable bounds are not directly captured
-            self.__scaled_inputs_list = scaling_object.get_scaled_input_expressions(self.inputs_list)
-            self.__scaled_outputs_list = scaling_object.get_scaled_output_expressions(self.outputs_list)
+            self.__scaled_inputs_list = scaling_object.get_scaled_input_expressions(self.__inputs_list)
+            self.__scaled_outputs_list = scaling_object.get_scaled_output_expressions(self.__outputs_list)
             #Bounds only set on unscaled inputs
-            self._setup_input_bounds(self.inputs_list,input_bounds)
+            self._setup_input_bounds(self.__inputs_list,input_bounds)
 
         else:
             #create pyomo variables for scaled and unscaled terms, input bounds are also scaled
@@ -153,15 +153,15 @@ class _BaseInputOutputBlockData(_BlockData):
             #Create constraints connecting scaled and unscaled variables
             self.__scale_input_con = pyo.Constraint(self.scaled_inputs_set)
             self.__unscale_output_con = pyo.Constraint(self.scaled_outputs_set)
-            scaled_input_expressions = scaling_object.get_scaled_input_expressions(self.inputs_list)
-            unscaled_output_expressions = scaling_object.get_unscaled_output_expressions(self.scaled_outputs_list)
+            scaled_input_expressions = scaling_object.get_scaled_input_expressions(self.__inputs_list)
+            unscaled_output_expressions = scaling_object.get_unscaled_output_expressions(self.__scaled_outputs_list)
 
             #scaled input constraints
             for i in range(len(self.scaled_inputs_set)):
                 self.__scale_input_con[i] = self.scaled_inputs[i] == scaled_input_expressions[i]
             #unscaled output constraints
             for i in range(len(self.scaled_outputs_set)):
-                self.__unscale_output_con[i] = self.outputs_list[i] == unscaled_output_expressions[i]
+                self.__unscale_output_con[i] = self.__outputs_list[i] == unscaled_output_expressions[i]
 
             # scale input bounds
             if input_bounds:
@@ -170,7 +170,7 @@ class _BaseInputOutputBlockData(_BlockData):
                 scaled_lower = scaling_object.get_scaled_input_expressions(input_lower)
                 scaled_upper = scaling_object.get_scaled_input_expressions(input_upper)
                 scaled_input_bounds = list(zip(scaled_lower,scaled_upper))
-                self._setup_input_bounds(self.scaled_inputs_list,scaled_input_bounds)
+                self._setup_input_bounds(self.__scaled_inputs_list,scaled_input_bounds)
         return  
 
     @property
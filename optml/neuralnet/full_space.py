@@ -1,6 +1,6 @@
 import pyomo.environ as pyo
 from ..formulation import _PyomoFormulation
-from ..utils import pyomo_activations
+from ..utils import _activation_functions, _build_linear_expressions
 
 class FullSpaceContinuousFormulation(_PyomoFormulation):
     def __init__(self, network_structure):
@@ -26,6 +26,10 @@ class FullSpaceContinuousFormulation(_PyomoFormulation):
             The convex relaxation barrier, revisited: Tightened single-neuron relaxations for neural network
             verification. arXiv preprint arXiv:2006.14076.
 
+        If the network definition provides input bounds, these are propagated through the
+        network (see NetworkDefinition.propagate_bounds) and set as bounds on the $\hat z$
+        variables. The formulation is then only valid within the input bounds, and fixing
+        an input to a value outside of them can make the model infeasible.
         """
         super(FullSpaceContinuousFormulation, self).__init__(network_structure)
 
@@ -53,45 +57,47 @@ def build_full_space_formulation(block, network_structure, skip_activations=Fals
     output_node_ids = net.output_node_ids()
     outputs_list = block.scaled_outputs_list
 
-    x = {input_node_ids[i]: inputs_list[i] for i in range(len(input_node_ids))}
-    y = {output_node_ids[i]: outputs_list[i] for i in range(len(output_node_ids))}
+    x = dict(zip(input_node_ids, inputs_list))
+    y = dict(zip(output_node_ids, outputs_list))
 
     block.input_node_ids = pyo.Set(initialize=input_node_ids, ordered=True)
 
     # add the intermediate variables
-    block.nodes = pyo.Set(initialize=net.all_node_ids(), ordered=True)
+    # the input nodes do not get z variables, the inputs x are used directly instead
     block.hidden_output_nodes = pyo.Set(initialize=hidden_output_node_ids, ordered=True)
-    block.z = pyo.Var(block.nodes, initialize=0)  # post-activation
+    block.z = pyo.Var(block.hidden_output_nodes, initialize=0)  # post-activation
     block.zhat = pyo.Var(block.hidden_output_nodes, initialize=0)  # pre-activation
 
-    # define the input constraints
-    inputs = x
-
-    # Todo: We could eliminate these constraints and use x[i] directly where applicable
-    block.input_constraints = pyo.Constraint(input_node_ids)
-    for i in input_node_ids:
-        block.input_constraints[i] = block.z[i] == inputs[i]
+    # flat list of the post-activation values indexed by node id
+    z = [x[i] for i in input_node_ids]
+    z.extend(block.z[i] for i in block.hidden_output_nodes)
 
     # define the linear constraints
+    # the scaled inputs are expressions when the block uses scaling expressions, and those
+    # cannot be used as the variables of a LinearExpression
     block.linear_constraints = pyo.Constraint(block.hidden_output_nodes)
-    w = net.weights
     b = net.biases
-    for i in block.hidden_output_nodes:
-        block.linear_constraints[i] = block.zhat[i] == sum(w[i][j] * block.z[j] for j in w[i]) + b[i]
+    linear_exprs = _build_linear_expressions(*net.weight_csr(),
+                                             z=z,
+                                             biases=[b[i] for i in block.hidden_output_nodes],
+                                             linear_vars=all(v.is_variable_type() for v in inputs_list))
+    for i, expr in zip(block.hidden_output_nodes, linear_exprs):
+        block.linear_constraints[i] = block.zhat[i] == expr
+
+    # bound the pre-activation values using the input bounds (if provided)
+    bounds = net.propagate_bounds()
+    if bounds is not None:
+        for i, lb, ub in zip(block.hidden_output_nodes, *(bnd.tolist() for bnd in bounds)):
+            block.zhat[i].setlb(lb if lb > -float('inf') else None)
+            block.zhat[i].setub(ub if ub < float('inf') else None)
 
     # define the activation constraints
     if not skip_activations:
         activations = net.activations
+        afuncs = _activation_functions(activations, block.hidden_output_nodes)
         block.activation_constraints = pyo.Constraint(block.hidden_output_nodes)
-        for i in block.hidden_output_nodes:
-            if i not in activations or activations[i] is None or activations[i] == 'linear':
-                block.activation_constraints[i] = block.z[i] == block.zhat[i]
-            elif type(activations[i]) is str:
-                afunc = pyomo_activations[activations[i]]
-                block.activation_constraints[i] = block.z[i] == afunc(block.zhat[i])
-            else:
-                # better have given us a function that is valid for pyomo expressions
-                block.activation_constraints[i] = block.z[i] == activations[i](block.zhat[i])
+        for i, afunc in zip(block.hidden_output_nodes, afuncs):
+            block.activation_constraints[i] = block.z[i] == afunc(block.zhat[i])
 
     # define the output constraints
     outputs = {i: block.z[i] for i in output_node_ids}
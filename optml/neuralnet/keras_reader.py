@@ -1,3 +1,4 @@
+import numpy as np
 from optml.neuralnet.network_definition import NetworkDefinition
 
 def load_keras_sequential(nn,scaling_object=None,input_bounds=None):
@@ -16,29 +17,47 @@ def load_keras_sequential(nn,scaling_object=None,input_bounds=None):
     NetworkDefinition
     """
     # Todo: Add support for DistributionLambda layers
-    n_inputs = len(nn.layers[0].get_weights()[0])
-    n_outputs = len(nn.layers[-1].get_weights()[1])
+    # each get_weights() call copies the layer tensors, so only do it once per layer
+    all_weights = [l.get_weights() for l in nn.layers]
+    layer_shapes = [weights.shape for weights, _ in all_weights]
+    n_inputs = layer_shapes[0][0]
+    n_outputs = layer_shapes[-1][1]
+    n_hidden = sum(n_layer_nodes for _, n_layer_nodes in layer_shapes) - n_outputs
+
+    # preallocate the compressed sparse row form of the weights, one row per non-input node
+    nnz = sum(n_layer_inputs * n_layer_nodes for n_layer_inputs, n_layer_nodes in layer_shapes)
+    indptr = np.zeros(n_hidden + n_outputs + 1, dtype=np.int64)
+    indices = np.empty(nnz, dtype=np.int64)
+    data = np.empty(nnz, dtype=np.float64)
+
     node_id_offset = n_inputs
     layer_offset = 0
+    nz_offset = 0
     w = dict()
     b = dict()
     a = dict()
-    for l in nn.layers:
+    for l, (weights, biases) in zip(nn.layers, all_weights):
         cfg = l.get_config()
-        weights, biases = l.get_weights()
         n_layer_inputs, n_layer_nodes = weights.shape
+        # pull each column out of numpy in bulk rather than one scalar at a time
+        W = np.ascontiguousarray(weights)
+        biases = np.asarray(biases).tolist()
+        keys = list(range(layer_offset, layer_offset + n_layer_inputs))
+
+        row = node_id_offset - n_inputs
+        layer_nnz = n_layer_inputs * n_layer_nodes
+        indptr[row+1:row+n_layer_nodes+1] = nz_offset + n_layer_inputs * np.arange(1, n_layer_nodes + 1)
+        indices[nz_offset:nz_offset+layer_nnz].reshape(n_layer_nodes, n_layer_inputs)[:] = keys
+        data[nz_offset:nz_offset+layer_nnz].reshape(n_layer_nodes, n_layer_inputs)[:] = W.T
+        nz_offset += layer_nnz
+
         for i in range(n_layer_nodes):
-            layer_w = dict()
-            for j in range(n_layer_inputs):
-                layer_w[j+layer_offset] = weights[j,i]
-            w[node_id_offset] = layer_w
+            w[node_id_offset] = dict(zip(keys, W[:, i].tolist()))
             b[node_id_offset] = biases[i]
             # ToDo: leaky ReLU
             a[node_id_offset] = cfg['activation']
             node_id_offset += 1
         layer_offset += n_layer_inputs
-    n_nodes = len(a) + n_inputs
-    n_hidden = n_nodes - n_inputs - n_outputs
     return NetworkDefinition(n_inputs=n_inputs,
                               n_hidden=n_hidden,
                               n_outputs=n_outputs,
@@ -46,5 +65,6 @@ def load_keras_sequential(nn,scaling_object=None,input_bounds=None):
                               biases=b,
                               activations=a,
                               scaling_object=scaling_object,
-                              input_bounds=input_bounds
+                              input_bounds=input_bounds,
+                              weight_csr=(indptr, indices, data)
                             )
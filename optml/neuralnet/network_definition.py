@@ -1,8 +1,35 @@
 import warnings
+from enum import IntEnum
+import numpy as np
+from ..utils import numpy_activations
+
+class ActivationCode(IntEnum):
+    """ Integer codes classifying the activation of each non-input node (see
+    NetworkDefinition.activation_codes) """
+    LINEAR = 0
+    RELU = 1
+    NONLINEAR = 2
+
+_activation_codes = {None: ActivationCode.LINEAR, 'linear': ActivationCode.LINEAR, 'relu': ActivationCode.RELU}
+
+def _build_weight_csr(weights, node_ids):
+    """ Build the (indptr, indices, data) arrays for the weights dictionary with one row
+    for every node in node_ids """
+    indptr = [0]
+    indices = list()
+    data = list()
+    for i in node_ids:
+        w_i = weights[i]
+        indices.extend(w_i.keys())
+        data.extend(w_i.values())
+        indptr.append(len(indices))
+    return (np.array(indptr, dtype=np.int64),
+            np.array(indices, dtype=np.int64),
+            np.array(data, dtype=np.float64))
 
 class NetworkDefinition(object):
     def __init__(self, n_inputs, n_hidden, n_outputs, weights, biases,
-                 activations, scaling_object=None, input_bounds=None):
+                 activations, scaling_object=None, input_bounds=None, weight_csr=None):
         """
         This class provides the neural network structure in a way that is *similar* to
         that provided in [1] as defined by:
@@ -46,7 +73,20 @@ class NetworkDefinition(object):
             This object must support the ScalingInterface (see scaling.py)
         input_bounds: list of tuples
             List of tuples where each tuple contains the lower and upper bound for an UNSCALED input 
-            e.g. input_bounds = [(lb1,ub1),(lb2,ub2),(lb3,ub3)] for 3 inputs
+            e.g. input_bounds = [(lb1,ub1),(lb2,ub2),(lb3,ub3)] for 3 inputs. A bound of None
+            means the input is unbounded in that direction. The full space formulations use
+            these bounds to bound the pre-activation values, so inputs outside of them
+            can make those formulations infeasible.
+        weight_csr: tuple of numpy arrays or None
+            Optional (indptr, indices, data) arrays holding the same information as weights in
+            compressed sparse row form (see weight_csr()). If None, these are built from the
+            weights dictionary here. A ValueError is raised if the row lengths do not match
+            the weights dictionary.
+
+        The network definition should not be modified after it is constructed. The weight
+        arrays and activation codes are built from the weights and activations dictionaries
+        once, so later changes to those dictionaries are not seen by weight_csr(),
+        activation_codes() or propagate_bounds().
         """
         self.__n_inputs = n_inputs
         self.__n_hidden = n_hidden
@@ -64,6 +104,10 @@ class NetworkDefinition(object):
         if len(biases) != n_hidden + n_outputs:
             raise ValueError('The length of the biases dictionary should match '
                              'n_hidden + n_outputs')
+        node_ids = range(n_inputs, n_inputs + n_hidden + n_outputs)
+        if sorted(weights) != list(node_ids):
+            raise ValueError('The weights dictionary should have an entry for every node '
+                             'n_inputs .. n_inputs + n_hidden + n_outputs - 1')
         if input_bounds == None:
             warnings.warn("No input bounds were provided. This may lead to extrapolation outside of the training data")
         else:
@@ -72,6 +116,27 @@ class NetworkDefinition(object):
             if not all(len(i) == 2 for i in input_bounds):
                 raise ValueError('The elements of input_bounds must be tuples of length 2 containing (lower_bound,upper_bound)')
 
+        if weight_csr is None:
+            weight_csr = _build_weight_csr(weights, node_ids)
+        else:
+            indptr, indices, data = weight_csr
+            if len(indptr) != n_hidden + n_outputs + 1 or indptr[0] != 0 or \
+                    len(indices) != indptr[-1] or len(data) != indptr[-1]:
+                raise ValueError('The weight_csr arrays should have one row for every '
+                                 'entry in the weights dictionary')
+            if not np.array_equal(np.diff(indptr), [len(weights[i]) for i in node_ids]):
+                raise ValueError('The row lengths of weight_csr should match the weights dictionary')
+        for arr in weight_csr:
+            arr.setflags(write=False)
+        self.__weight_csr = weight_csr
+
+        n_nodes = n_hidden + n_outputs
+        self.__activation_codes = np.fromiter(
+            (_activation_codes.get(activations.get(i), ActivationCode.NONLINEAR)
+             for i in range(n_inputs, n_inputs + n_nodes)),
+            dtype=np.int8, count=n_nodes)
+        self.__activation_codes.setflags(write=False)
+
         # todo: we should probably add more error checking here
 
     @property
@@ -114,6 +179,66 @@ class NetworkDefinition(object):
         """ Return a list of tuples containing lower and upper bounds of neural network inputs"""
         return self.__input_bounds
 
+    def weight_csr(self):
+        """ Return the weights in compressed sparse row form as a tuple of read-only numpy arrays
+        (indptr, indices, data). Row k corresponds to node n_x+k, and its upstream node ids
+        and weights are indices[indptr[k]:indptr[k+1]] and data[indptr[k]:indptr[k+1]] """
+        return self.__weight_csr
+
+    def activation_codes(self):
+        """ Return a read-only int8 numpy array with one entry per non-input node (entry i-n_x
+        for node i) holding the ActivationCode of its activation """
+        return self.__activation_codes
+
+    def propagate_bounds(self):
+        """ Return (lb, ub) numpy arrays of valid bounds on the pre-activation values \hat z
+        for every non-input node (entry i-n_x for node i). These are found by propagating the
+        scaled input bounds through the network with interval arithmetic. Bounds that cannot
+        be determined are infinite, and None is returned if there are no input bounds. """
+        if self.input_bounds is None:
+            return None
+        x_lb = [bnd[0] for bnd in self.input_bounds]
+        x_ub = [bnd[1] for bnd in self.input_bounds]
+        if self.scaling_object is not None:
+            x_lb = self.scaling_object.get_scaled_input_expressions(x_lb)
+            x_ub = self.scaling_object.get_scaled_input_expressions(x_ub)
+        x_lb = np.array([-np.inf if v is None else v for v in x_lb], dtype=np.float64)
+        x_ub = np.array([np.inf if v is None else v for v in x_ub], dtype=np.float64)
+
+        n_inputs = self.n_inputs
+        codes = self.activation_codes()
+        n_nodes = len(codes)
+        indptr, indices, data = self.weight_csr()
+        w_pos = np.maximum(data, 0.0)
+        w_neg = np.minimum(data, 0.0)
+
+        # bounds on the post-activation values z for all nodes
+        z_lb = np.empty(n_inputs + n_nodes)
+        z_ub = np.empty(n_inputs + n_nodes)
+        z_lb[:n_inputs] = np.minimum(x_lb, x_ub)
+        z_ub[:n_inputs] = np.maximum(x_lb, x_ub)
+        zhat_lb = np.empty(n_nodes)
+        zhat_ub = np.empty(n_nodes)
+        # nansum drops the 0*inf terms from zero weights on unbounded nodes
+        with np.errstate(invalid='ignore', over='ignore'):
+            for k in range(n_nodes):
+                i = n_inputs + k
+                start, end = indptr[k], indptr[k+1]
+                j = indices[start:end]
+                b = self.__biases[i]
+                zhat_lb[k] = np.nansum(w_pos[start:end] * z_lb[j]) + np.nansum(w_neg[start:end] * z_ub[j]) + b
+                zhat_ub[k] = np.nansum(w_pos[start:end] * z_ub[j]) + np.nansum(w_neg[start:end] * z_lb[j]) + b
+                if codes[k] == ActivationCode.LINEAR:
+                    z_lb[i], z_ub[i] = zhat_lb[k], zhat_ub[k]
+                elif codes[k] == ActivationCode.RELU:
+                    z_lb[i], z_ub[i] = max(zhat_lb[k], 0.0), max(zhat_ub[k], 0.0)
+                elif self.__activations.get(i) in numpy_activations:
+                    afunc = numpy_activations[self.__activations[i]]
+                    z_lb[i], z_ub[i] = afunc(zhat_lb[k]), afunc(zhat_ub[k])
+                else:
+                    z_lb[i], z_ub[i] = -np.inf, np.inf
+        return zhat_lb, zhat_ub
+
     @scaling_object.setter
     def scaling_object(self, scaling_object):
         self.__scaling_object = scaling_object
@@ -121,22 +246,22 @@ class NetworkDefinition(object):
     def input_node_ids(self):
         """ Return the ids associated with all the input nodes.
         This is {0 .. n_x-1} """
-        return [i for i in range(self.n_inputs)]
+        return list(range(self.n_inputs))
 
     def hidden_node_ids(self):
         """ Return the ids associated with all of the hidden nodes.
         This is {n_x .. n_x+n_h-1} """
-        return [i for i in range(self.n_inputs, self.n_inputs+self.n_hidden)]
+        return list(range(self.n_inputs, self.n_inputs+self.n_hidden))
 
     def output_node_ids(self):
         """ Return the ids associated with all of the output nodes.
         This is {n_x+n_h .. n_x+n_h+n_y-1} """
-        return [i for i in range(self.n_inputs + self.n_hidden,
-                                 self.n_inputs + self.n_hidden + self.n_outputs)]
+        return list(range(self.n_inputs + self.n_hidden,
+                          self.n_inputs + self.n_hidden + self.n_outputs))
 
     def all_node_ids(self):
         """ Return the ids associated with all of the nodes.
         This is {0 .. n_x+n_h+n_y-1} """
-        return [i for i in range(0, self.n_inputs + self.n_hidden + self.n_outputs)]
+        return list(range(0, self.n_inputs + self.n_hidden + self.n_outputs))
 
 
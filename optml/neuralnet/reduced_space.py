@@ -1,6 +1,6 @@
 import pyomo.environ as pyo
 from ..formulation import _PyomoFormulation
-from ..utils import pyomo_activations
+from ..utils import _activation_functions, _build_linear_expressions
 
 class ReducedSpaceContinuousFormulation(_PyomoFormulation):
     def __init__(self, network_structure):
@@ -33,8 +33,8 @@ def build_reduced_space_formulation(block, network_structure, skip_activations=F
     hidden_output_node_ids.extend(net.output_node_ids())
     output_node_ids = net.output_node_ids()
     outputs_list = block.scaled_outputs_list
-    x = {input_node_ids[i]: inputs_list[i] for i in range(len(input_node_ids))}
-    y = {output_node_ids[i]: outputs_list[i] for i in range(len(output_node_ids))}
+    x = dict(zip(input_node_ids, inputs_list))
+    y = dict(zip(output_node_ids, outputs_list))
 
     # add the intermediate variables
     block.nodes = pyo.Set(initialize=net.all_node_ids(), ordered=True)
@@ -52,23 +52,19 @@ def build_reduced_space_formulation(block, network_structure, skip_activations=F
 
     # define the linear constraints
     block.linear_constraints = pyo.Constraint(block.hidden_output_nodes)
-    w = net.weights
     b = net.biases
-    for i in block.hidden_output_nodes:
-        block.zhat[i] = sum(w[i][j] * block.z[j] for j in w[i]) + b[i]
+    linear_exprs = _build_linear_expressions(*net.weight_csr(),
+                                             z=[block.z[j] for j in block.nodes],
+                                             biases=[b[i] for i in block.hidden_output_nodes])
+    for i, expr in zip(block.hidden_output_nodes, linear_exprs):
+        block.zhat[i] = expr
 
     # define the activation constraints
     if not skip_activations:
         activations = net.activations
-        for i in block.hidden_output_nodes:
-            if i not in activations or activations[i] is None or activations[i] == 'linear':
-                block.z[i] = block.zhat[i]
-            elif type(activations[i]) is str:
-                afunc = pyomo_activations[activations[i]]
-                block.z[i] = afunc(block.zhat[i])
-            else:
-                # better have given us a function that is valid for pyomo expressions
-                block.z[i] = activations[i](block.zhat[i])
+        afuncs = _activation_functions(activations, block.hidden_output_nodes)
+        for i, afunc in zip(block.hidden_output_nodes, afuncs):
+            block.z[i] = afunc(block.zhat[i])
 
     # define the output constraints
     outputs = {i: block.z[i] for i in output_node_ids}
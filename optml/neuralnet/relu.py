@@ -1,12 +1,16 @@
+import numpy as np
 import pyomo.environ as pyo
 import pyomo.mpec as mpec
 from ..formulation import _PyomoFormulation
 from .full_space import build_full_space_formulation
+from .network_definition import ActivationCode
 
 class ReLUBigMFormulation(_PyomoFormulation):
     def __init__(self, network_structure,M = 1e6):
         """ This class provides a full-space formulation of a neural network with ReLU
-        activation functions using a MILP representation.
+        activation functions using a MILP representation. If the network definition
+        provides input bounds, node specific big-M values are computed by propagating
+        these bounds through the network, and M is only used as an upper limit.
         """
         super(ReLUBigMFormulation, self).__init__(network_structure)
         self.M = M
@@ -35,46 +39,51 @@ class ReLUComplementarityFormulation(_PyomoFormulation):
                                      network_structure=self.network_definition,
                                      transform = self.transform)
 
+def _partition_relu_nodes(net):
+    """ Split the non-input nodes of the network into (linear_nodes, relu_nodes) based on
+    their activation codes. Any other activation raises a ValueError. """
+    codes = net.activation_codes()
+    unsupported = np.flatnonzero(codes == ActivationCode.NONLINEAR)
+    if len(unsupported) > 0:
+        i = net.n_inputs + int(unsupported[0])
+        raise ValueError('Activation function {} not supported in the ReLU formulation'.format(net.activations[i]))
+    node_ids = np.arange(net.n_inputs, net.n_inputs + len(codes))
+    return node_ids[codes == ActivationCode.LINEAR].tolist(), node_ids[codes == ActivationCode.RELU].tolist()
+
 def build_relu_mip_formulation(block, network_structure, M=1e6):
     # build the full space structure without activations
     build_full_space_formulation(block, network_structure, skip_activations=True)
 
     net = network_structure
-    linear_nodes = list()
-    relu_nodes = list()
-    activations = net.activations
-    # block.activation_constraints = pyo.Constraint(block.hidden_output_nodes)
-    for i in block.hidden_output_nodes:
-        if i not in activations or activations[i] is None or activations[i] == 'linear':
-            linear_nodes.append(i)
-        elif activations[i] == 'relu':
-            relu_nodes.append(i)
-        else:
-            raise ValueError('Activation function {} not supported in the ReLU formulation'.format(activations[i]))
-
-    block.relu_nodes = pyo.Set(initialize=relu_nodes, ordered=True)
-    block.linear_nodes = pyo.Set(initialize=linear_nodes, ordered=True)
+    linear_nodes, relu_nodes = _partition_relu_nodes(net)
+
+    block.relu_nodes = pyo.Set(initialize=relu_nodes, ordered=False)
+    block.linear_nodes = pyo.Set(initialize=linear_nodes, ordered=False)
 
     # # activation indicator q=0 means z=zhat (positive part of the hinge)
     # # q=1 means we are on the zero part of the hinge
     # block.hidden_nodes = net.hidden_node_ids()
     block.q = pyo.Var(block.relu_nodes, within=pyo.Binary)
-    block._z_lower_bound = pyo.Constraint(block.relu_nodes)
-    block._z_hat_bound = pyo.Constraint(block.relu_nodes)
-    block._z_hat_positive = pyo.Constraint(block.relu_nodes)
-    block._z_hat_negative = pyo.Constraint(block.relu_nodes)
-    block._linear_activation = pyo.Constraint(block.linear_nodes)
+
+    # the big-M values only need to cover the range of zhat on each relu node
+    # (bounded by the full space formulation when input bounds are provided)
+    M_lb = dict()
+    M_ub = dict()
+    for i in relu_nodes:
+        lb, ub = block.zhat[i].bounds
+        M_lb[i] = M if lb is None else min(M, max(-lb, 0.0))
+        M_ub[i] = M if ub is None else min(M, max(ub, 0.0))
 
     # relu logic
-    for i in block.relu_nodes:
-        block._z_lower_bound[i] = block.z[i] >= 0
-        block._z_hat_bound[i] = block.z[i] >= block.zhat[i]
-        block._z_hat_positive[i] = block.z[i] <= block.zhat[i] + M * block.q[i]
-        block._z_hat_negative[i] = block.z[i] <= M * (1.0 - block.q[i])
+    block._z_lower_bound = pyo.Constraint(block.relu_nodes, rule=lambda b, i: b.z[i] >= 0)
+    block._z_hat_bound = pyo.Constraint(block.relu_nodes, rule=lambda b, i: b.z[i] >= b.zhat[i])
+    block._z_hat_positive = pyo.Constraint(block.relu_nodes,
+                                           rule=lambda b, i: b.z[i] <= b.zhat[i] + M_lb[i] * b.q[i])
+    block._z_hat_negative = pyo.Constraint(block.relu_nodes,
+                                           rule=lambda b, i: b.z[i] <= M_ub[i] * (1.0 - b.q[i]))
 
     # linear activations
-    for i in block.linear_nodes:
-        block._linear_activation[i] = block.z[i] == block.zhat[i]
+    block._linear_activation = pyo.Constraint(block.linear_nodes, rule=lambda b, i: b.z[i] == b.zhat[i])
 
 
 def build_relu_complementarity_formulation(block, network_structure, transform='mpec.simple_nonlinear'):
@@ -82,20 +91,10 @@ def build_relu_complementarity_formulation(block, network_structure, transform='
     build_full_space_formulation(block, network_structure, skip_activations=True)
 
     net = network_structure
-    linear_nodes = list()
-    relu_nodes = list()
-    activations = net.activations
-    # block.activation_constraints = pyo.Constraint(block.hidden_output_nodes)
-    for i in block.hidden_output_nodes:
-        if i not in activations or activations[i] is None or activations[i] == 'linear':
-            linear_nodes.append(i)
-        elif activations[i] == 'relu':
-            relu_nodes.append(i)
-        else:
-            raise ValueError('Activation function {} not supported in the ReLU formulation'.format(activations[i]))
-
-    block.relu_nodes = pyo.Set(initialize=relu_nodes, ordered=True)
-    block.linear_nodes = pyo.Set(initialize=linear_nodes, ordered=True)
+    linear_nodes, relu_nodes = _partition_relu_nodes(net)
+
+    block.relu_nodes = pyo.Set(initialize=relu_nodes, ordered=False)
+    block.linear_nodes = pyo.Set(initialize=linear_nodes, ordered=False)
 
     block._complementarity = mpec.Complementarity(block.relu_nodes)
     block._linear_activation = pyo.Constraint(block.linear_nodes)
@@ -4,6 +4,14 @@ import os.path
 from optml.neuralnet.keras_reader import load_keras_sequential
 from pyomo.common.fileutils import this_file_dir
 
+def _check_weight_csr(net):
+    # row k of the CSR arrays should hold the weights of node n_inputs+k
+    indptr, indices, data = net.weight_csr()
+    for k, i in enumerate(range(net.n_inputs, net.n_inputs + net.n_hidden + net.n_outputs)):
+        start, end = indptr[k], indptr[k+1]
+        assert indices[start:end].tolist() == list(net.weights[i].keys())
+        assert data[start:end].tolist() == list(net.weights[i].values())
+
 def test_keras_reader():
     nn = keras.models.load_model(os.path.join(this_file_dir(),'models/keras_linear_131'))
     net = load_keras_sequential(nn)
@@ -15,6 +23,7 @@ def test_keras_reader():
     assert len(net.activations) == 4
     for k in net.activations:
         assert net.activations[k] == 'linear' # or net.activations[k] is None
+    _check_weight_csr(net)
 
     nn = keras.models.load_model(os.path.join(this_file_dir(),'./models/keras_linear_131_sigmoid'))
     net = load_keras_sequential(nn)
@@ -55,6 +64,7 @@ def test_keras_reader():
     assert len(net.weights) == 100*3+1
     assert len(net.biases) == 100*3+1
     assert len(net.activations) == 100*3+1
+    _check_weight_csr(net)
 
     for k in range(1,100*3+1):
         assert net.activations[k] == 'sigmoid'
@@ -41,12 +41,21 @@ def test_network_definition():
     assert nd.hidden_node_ids() == [2, 3]
     assert nd.output_node_ids() == [4]
 
+    indptr, indices, data = nd.weight_csr()
+    assert list(indptr) == [0, 1, 3, 5]
+    assert list(indices) == [0, 0, 1, 2, 3]
+    assert list(data) == [1.0, -2.0, -1.0, 2.0, -3.0]
+    assert list(nd.activation_codes()) == [0, 0, 0]
+
     with pytest.warns(UserWarning, match="No input bounds were provided. This may lead to extrapolation outside of the training data"):
         nd = NetworkDefinition(n_inputs, n_hidden, n_outputs, w, b, a)
 
     input_bounds = [(0,2),(-1,1)]
     nd = NetworkDefinition(n_inputs, n_hidden, n_outputs, w, b, a, input_bounds = input_bounds)
     assert nd.input_bounds == input_bounds
+    zhat_lb, zhat_ub = nd.propagate_bounds()
+    assert list(zhat_lb) == [1, -3, -4]
+    assert list(zhat_ub) == [3, 3, 18]
 
     with pytest.raises(ValueError):
         input_bounds = [(0,2),]
@@ -56,8 +65,12 @@ def test_network_definition():
         input_bounds = [(0,2),(3,)]
         nd = NetworkDefinition(n_inputs, n_hidden, n_outputs, w, b, a, input_bounds = input_bounds)
 
-    # Todo: this should be able to throw an error
-    nd = NetworkDefinition(1, n_hidden, n_outputs, w, b, a)
+    with pytest.raises(ValueError):
+        nd = NetworkDefinition(1, n_hidden, n_outputs, w, b, a)
+
+    with pytest.raises(ValueError):
+        w_skip = {2: w[2], 3: w[3], 5: w[4]}
+        nd = NetworkDefinition(n_inputs, n_hidden, n_outputs, w_skip, b, a)
 
     with pytest.raises(ValueError):
         nd = NetworkDefinition(n_inputs, 1, n_outputs, w, b, a)
\ No newline at end of file
@@ -44,8 +44,8 @@ def test_two_node_full_space():
     m.neural_net_block = OptMLBlock()
     formulation = FullSpaceContinuousFormulation(net)
     m.neural_net_block.build_formulation(formulation)
-    assert m.nvariables() == 12
-    assert m.nconstraints() == 11
+    assert m.nvariables() == 11
+    assert m.nconstraints() == 10
 
     m.neural_net_block.inputs[0].fix(-2)
     m.obj1 = pyo.Objective(expr = 0)
@@ -60,6 +60,56 @@ def test_two_node_full_space():
     assert abs(pyo.value(m.neural_net_block.outputs[0]) - -3.046376623823058) < 1e-8
     assert abs(pyo.value(m.neural_net_block.outputs[1]) - -0.7615941559557649) < 1e-8
 
+def test_two_node_full_space_bounds():
+    """
+    Test of the zhat bounds propagated from the input bounds for the following model:
+
+            1           1
+    x0 -------- (1) --------- (3)
+     |                   /
+     |                  /
+     |                 / 5
+     |                /
+     |               |
+     |    -1         |     1
+     ---------- (2) --------- (4)
+    """
+
+    n_inputs = 1
+    n_hidden = 2
+    n_outputs = 2
+    w = {1: {0: 1.0},
+         2: {0: -1.0},
+         3: {1: 1.0, 2: 5.0},
+         4: {2: 1.0}}
+    b = {1: 0, 2:0, 3:0, 4:0}
+    a = {1: 'tanh',
+         2: 'sigmoid'}
+
+    net = NetworkDefinition(n_inputs=n_inputs,
+                            n_hidden=n_hidden,
+                            n_outputs=n_outputs,
+                            weights=w,
+                            biases=b,
+                            activations=a,
+                            input_bounds=[(None, 1)])
+
+    m = pyo.ConcreteModel()
+    m.neural_net_block = OptMLBlock()
+    formulation = FullSpaceContinuousFormulation(net)
+    m.neural_net_block.build_formulation(formulation)
+
+    # infinite bounds are left as None
+    zhat = m.neural_net_block.zhat
+    assert zhat[1].lb is None
+    assert zhat[1].ub == pytest.approx(1.0)
+    assert zhat[2].lb == pytest.approx(-1.0)
+    assert zhat[2].ub is None
+    assert zhat[3].lb == pytest.approx(-1.0 + 5.0 / (1.0 + 2.718281828459045))
+    assert zhat[3].ub == pytest.approx(0.7615941559557649 + 5.0)
+    assert zhat[4].lb == pytest.approx(1.0 / (1.0 + 2.718281828459045))
+    assert zhat[4].ub == pytest.approx(1.0)
+
 def test_two_node_reduced_space_1():
     """
     Test of the following model:
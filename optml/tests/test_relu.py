@@ -1,5 +1,6 @@
 import pytest
 import pyomo.environ as pyo
+from pyomo.repn import generate_standard_repn
 from optml.block import OptMLBlock
 from optml.neuralnet.relu import ReLUBigMFormulation, ReLUComplementarityFormulation
 from optml.neuralnet.network_definition import NetworkDefinition
@@ -103,3 +104,67 @@ def test_two_node_complementarity():
     status = pyo.SolverFactory('ipopt').solve(m, tee=False)
     assert abs(pyo.value(m.neural_net_block.outputs[0]) - 1) < 1e-6
     assert abs(pyo.value(m.neural_net_block.outputs[1]) - 0) < 1e-6
+
+def test_two_node_bigm_bounds():
+    n_inputs = 1
+    n_hidden = 2
+    n_outputs = 2
+    w = {1: {0: 1.0},
+         2: {0: -1.0},
+         3: {1: 1.0, 2: 5.0},
+         4: {2: 1.0}}
+    b = {1: 0, 2:0, 3:0, 4:0}
+    a = {1: 'relu',
+         2: 'relu'}
+
+    net = NetworkDefinition(n_inputs=n_inputs,
+                            n_hidden=n_hidden,
+                            n_outputs=n_outputs,
+                            weights=w,
+                            biases=b,
+                            activations=a,
+                            input_bounds=[(-2,1)])
+
+    m = pyo.ConcreteModel()
+    m.neural_net_block = OptMLBlock()
+    formulation = ReLUBigMFormulation(net,M = 1e6)
+    m.neural_net_block.build_formulation(formulation)
+
+    def q_coef_and_constant(con, q):
+        repn = generate_standard_repn(con.body)
+        coefs = {id(v): c for v, c in zip(repn.linear_vars, repn.linear_coefs)}
+        return coefs[id(q)], repn.constant
+
+    # zhat[1] is in [-2, 1] and zhat[2] is in [-1, 2], so M is replaced by these bounds
+    blk = m.neural_net_block
+    for i, M_lb, M_ub in [(1, 2, 1), (2, 1, 2)]:
+        coef, constant = q_coef_and_constant(blk._z_hat_positive[i], blk.q[i])
+        assert coef == pytest.approx(-M_lb)
+        assert constant == pytest.approx(0)
+        coef, constant = q_coef_and_constant(blk._z_hat_negative[i], blk.q[i])
+        assert coef == pytest.approx(M_ub)
+        assert constant == pytest.approx(-M_ub)
+
+def test_unsupported_activation():
+    n_inputs = 1
+    n_hidden = 2
+    n_outputs = 2
+    w = {1: {0: 1.0},
+         2: {0: -1.0},
+         3: {1: 1.0, 2: 5.0},
+         4: {2: 1.0}}
+    b = {1: 0, 2:0, 3:0, 4:0}
+    a = {1: 'relu',
+         2: 'sigmoid'}
+
+    net = NetworkDefinition(n_inputs=n_inputs,
+                            n_hidden=n_hidden,
+                            n_outputs=n_outputs,
+                            weights=w,
+                            biases=b,
+                            activations=a)
+
+    m = pyo.ConcreteModel()
+    m.neural_net_block = OptMLBlock()
+    with pytest.raises(ValueError, match='Activation function sigmoid not supported'):
+        m.neural_net_block.build_formulation(ReLUBigMFormulation(net))
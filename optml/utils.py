@@ -1,5 +1,8 @@
+from itertools import chain, groupby, repeat
+import numpy as np
 import pyomo.environ as pyo
 from pyomo.core.base.var import ScalarVar, IndexedVar
+from pyomo.core.expr.numeric_expr import LinearExpression
 
 pyomo_activations = {
     'tanh': pyo.tanh,
@@ -7,6 +10,56 @@ pyomo_activations = {
     'softplus': lambda x: pyo.log(pyo.exp(x) + 1)
 }
 
+# numpy versions of pyomo_activations, used to propagate bounds through the network
+# (all of these activations are monotonically increasing)
+numpy_activations = {
+    'tanh': np.tanh,
+    'sigmoid': lambda x: 1 / (1 + np.exp(-x)),
+    'softplus': lambda x: np.log(np.exp(x) + 1)
+}
+
+def _identity(x):
+    return x
+
+def _activation_function(activation):
+    """ Return the pyomo-compatible function for an activation entry of a network definition.
+    None or 'linear' map to the identity and strings are looked up in pyomo_activations """
+    if activation is None or activation == 'linear':
+        return _identity
+    elif type(activation) is str:
+        return pyomo_activations[activation]
+    # better have given us a function that is valid for pyomo expressions
+    return activation
+
+def _activation_functions(activations, node_ids):
+    """ Return a list with the function from _activation_function for every node in node_ids.
+    Consecutive nodes usually share an activation (e.g., a layer), so each run of identical
+    activations is only resolved once. """
+    afuncs = list()
+    for activation, run in groupby(node_ids, key=activations.get):
+        afuncs.extend(repeat(_activation_function(activation), sum(1 for _ in run)))
+    return afuncs
+
+def _build_linear_expressions(indptr, indices, data, z, biases, linear_vars=False):
+    """ Return the list of expressions sum_j w_kj z_j + b_k, one for every row k of the
+    weights given in compressed sparse row form (indptr, indices, data). Here z is a flat
+    list indexed by node id and biases contains one entry per row. If linear_vars is True,
+    z must contain only variables and each row is built as a flat LinearExpression
+    rather than a nested sum. """
+    indptr = indptr.tolist()
+    indices = indices.tolist()
+    data = data.tolist()
+    exprs = list()
+    for k in range(len(indptr) - 1):
+        start, end = indptr[k], indptr[k+1]
+        if linear_vars:
+            exprs.append(LinearExpression(constant=biases[k],
+                                          linear_coefs=data[start:end],
+                                          linear_vars=[z[j] for j in indices[start:end]]))
+        else:
+            exprs.append(sum(w * z[j] for w, j in zip(data[start:end], indices[start:end])) + biases[k])
+    return exprs
+
 def _extract_var_data(vars):
     if isinstance(vars, ScalarVar):
         return [vars]
@@ -16,12 +69,6 @@ def _extract_var_data(vars):
         raise ValueError('Expected IndexedVar: {} to be indexed over an ordered set.'.format(vars))
     elif isinstance(vars, list):
         # Todo: the above if should check if the item supports iteration rather than only list?
-        varlist = list()
-        for v in vars:
-            if v.is_indexed():
-                varlist.extend(v.values())
-            else:
-                varlist.append(v)
-        return varlist
+        return list(chain.from_iterable(v.values() if v.is_indexed() else (v,) for v in vars))
     else:
         raise ValueError("Unknown variable type {}".format(vars))